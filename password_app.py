@@ -1,10 +1,12 @@
 import streamlit as st
-import re
-import math
-import hashlib
 import requests
-import random
-import string
+from password_core import (
+    calculate_entropy,
+    check_hibp_breach,
+    check_many,
+    generate_strong_password,
+    lookup_pool,
+)
 
 # Initialize Streamlit config FIRST
 st.set_page_config(
@@ -13,47 +15,12 @@ st.set_page_config(
     layout="centered"
 )
 
-# ---------------------------
-# Core Security Functions
-# ---------------------------
-
-def check_hibp_breach(password: str) -> bool:
-    """Check password against HIBP breach database"""
-    sha1_hash = hashlib.sha1(password.encode()).hexdigest().upper()
-    prefix, suffix = sha1_hash[:5], sha1_hash[5:]
-    response = requests.get(
-        f"https://api.pwnedpasswords.com/range/{prefix}",
-        headers={"User-Agent": "EnterpriseScanner"}
-    )
-    return any(line.split(':')[0] == suffix for line in response.text.splitlines())
-
-def calculate_entropy(password: str) -> float:
-    """Calculate password complexity in bits"""
-    charset = 0
-    if re.search(r'[a-z]', password): charset += 26
-    if re.search(r'[A-Z]', password): charset += 26
-    if re.search(r'\d', password): charset += 10
-    if re.search(r'[!@#$%^&*]', password): charset += 10
-    return len(password) * math.log2(charset) if charset else 0
-
-def generate_strong_password(length=12):
-    """Generate cryptographically secure password"""
-    chars = string.ascii_letters + string.digits + "!@#$%^&*"
-    while True:
-        password = ''.join(random.SystemRandom().choice(chars) for _ in range(length))
-        if all([re.search(r'[A-Z]', password),
-                re.search(r'[a-z]', password),
-                re.search(r'\d', password),
-                re.search(r'[!@#$%^&*]', password)]):
-            return password
-
 # ---------------------------
 # Professional Interface
 # ---------------------------
 
-def main():
-    # Custom CSS for animations and buttons
-    st.markdown("""
+# Custom CSS for animations and buttons
+_APP_CSS = """
     <style>
     @keyframes gradient {
         0% { background-position: 0% 50%; }
@@ -89,22 +56,21 @@ def main():
         transform: scale(1.02);
         box-shadow: 0 5px 15px rgba(33,150,243,0.3);
     }
-    
-    .button-container {
-        display: flex;
-        gap: 1rem;
-        justify-content: center;
-        margin: 2rem 0;
-    }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def _on_generate():
+    """Fill the password field before the button's rerun so no extra st.rerun() is needed"""
+    st.session_state.pass_input = generate_strong_password()
+    st.session_state.analyze_flag = True
+
+def main():
+    st.markdown(_APP_CSS, unsafe_allow_html=True)
 
     st.title("🔐 Enterprise Password Toolkit")
     st.markdown("---")
 
     # Session State Management
-    if 'current_pass' not in st.session_state:
-        st.session_state.current_pass = ""
     if 'analyze_flag' not in st.session_state:
         st.session_state.analyze_flag = False
 
@@ -112,37 +78,39 @@ def main():
     with st.container():
         col1, col2 = st.columns([4, 1])
         with col1:
-            user_input = st.text_input(
-                "Enter/Generate Password:", 
-                value=st.session_state.current_pass,
-                type="password",
-                key="pass_input",
-                placeholder="🔒 Type or generate password"
-            )
+            # Form batches typing and Analyze into a single rerun on submit;
+            # borderless so the input keeps its position next to the Generate spacer
+            with st.form("pw_form", border=False):
+                user_input = st.text_input(
+                    "Enter/Generate Password:", 
+                    type="password",
+                    key="pass_input",
+                    placeholder="🔒 Type or generate password"
+                )
+                analyze_clicked = st.form_submit_button("🚀 Analyze Password", 
+                                                        type="primary")
         with col2:
+            # Generate stays outside the form so it triggers its own rerun
             st.markdown("<div style='height:28px'></div>", unsafe_allow_html=True)
-            if st.button("🔑 Generate", 
-                        key="generate_btn",
-                        help="Generate military-grade password",
-                        type="secondary"):
-                st.session_state.current_pass = generate_strong_password()
-                st.session_state.analyze_flag = True
-                st.rerun()
-
-    # Centered Analyze Button with Animation
-    st.markdown('<div class="button-container">', unsafe_allow_html=True)
-    analyze_clicked = st.button("🚀 Analyze Password", 
-                               key="analyze_btn",
-                               type="primary")
-    st.markdown('</div>', unsafe_allow_html=True)
+            st.button("🔑 Generate", 
+                      key="generate_btn",
+                      help="Generate military-grade password",
+                      type="secondary",
+                      on_click=_on_generate)
 
     # Analysis Logic
     if analyze_clicked or st.session_state.analyze_flag:
+        # A Generate click requests exactly one analysis
+        st.session_state.analyze_flag = False
         if st.session_state.pass_input:
             with st.spinner("🔍 Scanning password security..."):
                 password = st.session_state.pass_input
-                is_breached = check_hibp_breach(password)
                 entropy = calculate_entropy(password)
+                # Obviously weak passwords are flagged regardless, so skip the network;
+                # otherwise start the lookup and render the entropy card while it is in flight
+                breach_future = None
+                if entropy >= 20 and len(password) >= 6:
+                    breach_future = lookup_pool().submit(check_hibp_breach, password)
                 
                 # Security Report
                 st.markdown("---")
@@ -154,13 +122,25 @@ def main():
                     with st.container(border=True):
                         st.metric("Entropy Score", f"{entropy:.1f} bits", 
                                  help="80+ bits recommended")
-                        st.progress(min(entropy/100, 1.0))
+                        st.progress(100 if entropy >= 100 else int(entropy))
+                lookup_failed = False
+                try:
+                    is_breached = breach_future.result() if breach_future else None
+                except requests.RequestException:
+                    is_breached, lookup_failed = None, True
                 with col2:
                     with st.container(border=True):
-                        st.metric("Breach Status", 
-                                 "⚠️ Compromised" if is_breached else "✅ Secure",
-                                 delta="Critical" if is_breached else "Safe",
-                                 delta_color="inverse")
+                        if lookup_failed:
+                            st.metric("Breach Status", "⚠️ Unavailable",
+                                     help="Breach database could not be reached")
+                        elif is_breached is None:
+                            st.metric("Breach Status", "➖ Not checked",
+                                     help="Not checked (password too weak to matter)")
+                        else:
+                            st.metric("Breach Status", 
+                                     "⚠️ Compromised" if is_breached else "✅ Secure",
+                                     delta="Critical" if is_breached else "Safe",
+                                     delta_color="inverse")
                 with col3:
                     risk_level = "High Risk" if entropy < 60 else "Low Risk"
                     st.metric("Risk Level", risk_level)
@@ -189,6 +169,36 @@ def main():
                         - Unique passwords per account
                         """)
 
+    # Bulk Audit Section
+    with st.expander("📂 Bulk Password Audit"):
+        # Form so the file is only scanned on submit, not on every later rerun
+        with st.form("bulk_form"):
+            uploaded = st.file_uploader("Upload a .txt file with one password per line",
+                                        type=["txt"],
+                                        key="bulk_upload")
+            scan_clicked = st.form_submit_button("🔍 Scan File")
+        if scan_clicked and uploaded is not None:
+            entries = [(num, line) for num, line in
+                       enumerate(uploaded.getvalue().decode("utf-8", "replace").splitlines(), 1)
+                       if line]
+            if entries:
+                with st.spinner(f"🔍 Scanning {len(entries)} passwords..."):
+                    results = check_many([line for _, line in entries])
+                compromised = [num for (num, _), hit in zip(entries, results) if hit]
+                unchecked = [num for (num, _), hit in zip(entries, results) if hit is None]
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Passwords Scanned", len(entries))
+                col2.metric("Compromised", len(compromised),
+                            delta="Critical" if compromised else "Safe",
+                            delta_color="inverse")
+                col3.metric("Not Checked", len(unchecked),
+                            help="Breach database could not be reached for these lines")
+                if compromised or unchecked:
+                    st.table([{"Line": num,
+                               "Breach Status": "⚠️ Compromised" if hit else "➖ Not checked"}
+                              for (num, _), hit in zip(entries, results)
+                              if hit or hit is None])
+
     st.markdown("---")
     st.caption("© 2025 CyberSecurity Pro | Developed by Areesha Tanoli")
 
@@ -0,0 +1,164 @@
+import streamlit as st
+import math
+import hashlib
+import os
+import requests
+from requests.adapters import HTTPAdapter
+import secrets
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# ---------------------------
+# Core Security Functions
+# ---------------------------
+
+@st.cache_resource
+def _hibp_session() -> requests.Session:
+    """Shared keep-alive session so HIBP lookups reuse TLS connections"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    session.headers.update({"User-Agent": "EnterpriseScanner", "Add-Padding": "true"})
+    return session
+
+_SUFFIX_LEN = 35
+
+# cache_resource shares the immutable blob instead of unpickling a copy per hit;
+# at ~35 KB per prefix the cap keeps the cache near 36 MB per process
+@st.cache_resource(ttl=3600, max_entries=1024, show_spinner=False)
+def _fetch_hibp_range(prefix: str) -> bytes:
+    """Fetch breached hash suffixes for a prefix as one sorted blob of 35-byte records"""
+    response = _hibp_session().get(f"https://api.pwnedpasswords.com/range/{prefix}",
+                                   timeout=10)
+    # Raise so failed lookups are not cached as "no breaches"
+    response.raise_for_status()
+    # Lines are "<35-char suffix>:<count>"; padding entries carry a count of 0
+    return b"".join(sorted(
+        line[:_SUFFIX_LEN] for line in response.content.splitlines()
+        if not line.endswith(b':0')
+    ))
+
+def _range_contains(records: bytes, suffix: bytes) -> bool:
+    """Binary search a sorted blob of fixed-width suffix records"""
+    lo, hi = 0, len(records) // _SUFFIX_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if records[mid * _SUFFIX_LEN:(mid + 1) * _SUFFIX_LEN] < suffix:
+            lo = mid + 1
+        else:
+            hi = mid
+    return records[lo * _SUFFIX_LEN:(lo + 1) * _SUFFIX_LEN] == suffix
+
+@st.cache_resource
+def _breached_hashes() -> set:
+    """SHA1 digests already found compromised (once pwned, always pwned)"""
+    return set()
+
+def _hibp_prefix(sha1_digest: bytes) -> str:
+    """5-character uppercase hex prefix sent to the HIBP range API"""
+    return sha1_digest.hex()[:5].upper()
+
+def _match_digest(records: bytes, sha1_digest: bytes) -> bool:
+    """Match a digest against its fetched range, remembering hits"""
+    if _range_contains(records, sha1_digest.hex()[5:].upper().encode()):
+        _breached_hashes().add(sha1_digest)
+        return True
+    return False
+
+@st.cache_data(ttl=600, max_entries=4096, show_spinner=False)
+def _breach_by_hash(sha1_digest: bytes) -> bool:
+    """Check a SHA1 digest against HIBP; the cache key is the digest, not the password string"""
+    if sha1_digest in _breached_hashes():
+        return True
+    return _match_digest(_fetch_hibp_range(_hibp_prefix(sha1_digest)), sha1_digest)
+
+def _sha1_digest(password: str) -> bytes:
+    """SHA1 of a password, used only as the HIBP k-anonymity lookup key"""
+    return hashlib.new("sha1", password.encode(), usedforsecurity=False).digest()
+
+def check_hibp_breach(password: str) -> bool:
+    """Check password against HIBP breach database"""
+    return _breach_by_hash(_sha1_digest(password))
+
+@st.cache_resource
+def lookup_pool() -> ThreadPoolExecutor:
+    """Background workers for interactive network lookups"""
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_resource
+def _bulk_pool() -> ThreadPoolExecutor:
+    """Separate workers for bulk audits so they cannot starve interactive lookups"""
+    return ThreadPoolExecutor(max_workers=8)
+
+# Prefixes in flight per round of a bulk audit
+_BULK_CHUNK = 64
+
+def _fetch_range_or_none(prefix: str) -> Optional[bytes]:
+    """Fetch a range for a bulk audit; None if HIBP could not be reached"""
+    try:
+        return _fetch_hibp_range(prefix)
+    except requests.RequestException:
+        return None
+
+def check_many(passwords: list[str]) -> list[Optional[bool]]:
+    """Check a batch of passwords in parallel; None marks entries HIBP could not check"""
+    digests = [_sha1_digest(p) for p in passwords]
+    breached = _breached_hashes()
+    results = [True if d in breached else None for d in digests]
+    by_prefix = {}
+    for i, d in enumerate(digests):
+        if results[i] is None:
+            by_prefix.setdefault(_hibp_prefix(d), []).append(i)
+    prefixes = list(by_prefix)
+    for start in range(0, len(prefixes), _BULK_CHUNK):
+        chunk = prefixes[start:start + _BULK_CHUNK]
+        # Match against the fetched blobs directly so range cache evictions never force a refetch
+        for prefix, records in zip(chunk, _bulk_pool().map(_fetch_range_or_none, chunk)):
+            if records is not None:
+                for i in by_prefix[prefix]:
+                    results[i] = _match_digest(records, digests[i])
+    return results
+
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_SYMBOLS = frozenset("!@#$%^&*")
+_CLASS_SIZES = (26, 26, 10, 10)
+# log2 of the charset size for every combination of classes, indexed by presence bitmask
+_LOG2_BY_MASK = tuple(
+    math.log2(sum(size for bit, size in enumerate(_CLASS_SIZES) if mask >> bit & 1)) if mask else 0.0
+    for mask in range(1 << len(_CLASS_SIZES))
+)
+
+def calculate_entropy(password: str) -> float:
+    """Calculate password complexity in bits"""
+    seen = set(password)
+    mask = ((not _LOWER.isdisjoint(seen))
+            | (not _UPPER.isdisjoint(seen)) << 1
+            | (not _DIGITS.isdisjoint(seen)) << 2
+            | (not _SYMBOLS.isdisjoint(seen)) << 3)
+    return len(password) * _LOG2_BY_MASK[mask]
+
+_PWD_CHARS = (string.ascii_letters + string.digits + "!@#$%^&*").encode()
+_PWD_N = len(_PWD_CHARS)
+# Bytes at or above the largest multiple of the alphabet size are rejected to avoid modulo bias
+_PWD_LIMIT = 256 - 256 % _PWD_N
+
+def generate_strong_password(length=12):
+    """Generate cryptographically secure password"""
+    if length < 4:
+        raise ValueError("length must be at least 4 to include every character class")
+    # One character from each class guarantees the mix without a retry loop
+    password = [
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.digits),
+        secrets.choice("!@#$%^&*"),
+    ]
+    remaining = length - len(password)
+    fill = bytearray()
+    while len(fill) < remaining:
+        fill += bytes(_PWD_CHARS[b % _PWD_N] for b in os.urandom(remaining * 2) if b < _PWD_LIMIT)
+    password += fill[:remaining].decode()
+    secrets.SystemRandom().shuffle(password)
+    return ''.join(password)
@@ -0,0 +1,182 @@
+import itertools
+import math
+import string
+
+import pytest
+import requests
+
+import password_core
+
+CLASS_SAMPLES = (("a", 26), ("A", 26), ("1", 10), ("!", 10))
+SYMBOLS = "!@#$%^&*"
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """Serves canned range bodies by prefix and records every requested prefix"""
+
+    def __init__(self, bodies=None, status_codes=None):
+        self.bodies = bodies or {}
+        self.status_codes = status_codes or {}
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        prefix = url.rsplit("/", 1)[-1]
+        self.requested.append(prefix)
+        return FakeResponse(self.bodies.get(prefix, b""), self.status_codes.get(prefix, 200))
+
+
+def _clear_all():
+    password_core._fetch_hibp_range.clear()
+    password_core._breach_by_hash.clear()
+    password_core._breached_hashes.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    _clear_all()
+    yield
+    _clear_all()
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(password_core, "_hibp_session", lambda: session)
+    return session
+
+
+def _hex(password):
+    return password_core._sha1_digest(password).hex().upper()
+
+
+@pytest.mark.parametrize("count", range(len(CLASS_SAMPLES) + 1))
+def test_calculate_entropy_every_class_combination(count):
+    for combo in itertools.combinations(CLASS_SAMPLES, count):
+        password = "".join(sample for sample, _ in combo) * 3
+        charset = sum(size for _, size in combo)
+        expected = len(password) * math.log2(charset) if charset else 0
+        assert password_core.calculate_entropy(password) == pytest.approx(expected)
+
+
+def test_calculate_entropy_ignores_other_characters():
+    assert password_core.calculate_entropy("   ") == 0
+    assert password_core.calculate_entropy("ab ") == pytest.approx(3 * math.log2(26))
+
+
+@pytest.mark.parametrize("length", [4, 12, 30])
+def test_generate_strong_password_length_and_classes(length):
+    allowed = set(string.ascii_letters + string.digits + SYMBOLS)
+    for _ in range(50):
+        password = password_core.generate_strong_password(length)
+        assert len(password) == length
+        assert set(password) <= allowed
+        assert any(c in string.ascii_uppercase for c in password)
+        assert any(c in string.ascii_lowercase for c in password)
+        assert any(c in string.digits for c in password)
+        assert any(c in SYMBOLS for c in password)
+
+
+def test_generate_strong_password_rejects_short_length():
+    with pytest.raises(ValueError):
+        password_core.generate_strong_password(3)
+
+
+def test_check_many_groups_prefixes_and_reports_failures(monkeypatch):
+    breached, clean, unreachable = "password", "correct horse battery", "letmein"
+    failing_prefix = _hex(unreachable)[:5]
+    calls = []
+
+    def fake_fetch(prefix):
+        calls.append(prefix)
+        if prefix == failing_prefix:
+            raise requests.HTTPError("429 Too Many Requests")
+        return _hex(breached)[5:].encode()
+
+    monkeypatch.setattr(password_core, "_fetch_hibp_range", fake_fetch)
+
+    results = password_core.check_many([breached, clean, breached, unreachable])
+
+    assert results == [True, False, True, None]
+    assert set(calls) == {_hex(p)[:5] for p in (breached, clean, unreachable)}
+    # Unreachable prefixes are not retried when matching
+    assert calls.count(failing_prefix) == 1
+
+
+def test_check_many_more_prefixes_than_range_cache(fake_session):
+    passwords, seen = [], set()
+    for i in range(3000):
+        prefix = _hex(f"pw-{i}")[:5]
+        if prefix not in seen:
+            seen.add(prefix)
+            passwords.append(f"pw-{i}")
+        if len(passwords) == 1500:
+            break
+    breached = passwords[-1]
+    fake_session.bodies[_hex(breached)[:5]] = _hex(breached)[5:].encode() + b":7"
+
+    results = password_core.check_many(passwords)
+
+    assert results == [False] * (len(passwords) - 1) + [True]
+    # Every prefix is fetched exactly once even though the range cache holds fewer entries
+    assert len(fake_session.requested) == len(passwords)
+    assert password_core._sha1_digest(breached) in password_core._breached_hashes()
+
+
+def _suffix(char):
+    return (char * 35).encode()
+
+
+def test_fetch_hibp_range_parses_suffixes_and_drops_padding(fake_session):
+    fake_session.bodies["ABCDE"] = (
+        _suffix("F") + b":10\r\n"
+        + _suffix("0") + b":0\r\n"
+        + _suffix("A") + b":3\r\n"
+    )
+
+    records = password_core._fetch_hibp_range("ABCDE")
+
+    # Sorted fixed-width records; the ":0" padding entry is dropped, ":10" is kept
+    assert records == _suffix("A") + _suffix("F")
+    assert password_core._range_contains(records, _suffix("F"))
+    assert not password_core._range_contains(records, _suffix("0"))
+
+
+def test_fetch_failures_propagate_and_are_not_cached(fake_session):
+    password = "hunter2-hunter2"
+    prefix, suffix = _hex(password)[:5], _hex(password)[5:].encode()
+    fake_session.status_codes[prefix] = 429
+
+    with pytest.raises(requests.HTTPError):
+        password_core.check_hibp_breach(password)
+
+    fake_session.status_codes[prefix] = 200
+    fake_session.bodies[prefix] = suffix + b":42"
+
+    assert password_core.check_hibp_breach(password) is True
+    assert fake_session.requested == [prefix, prefix]
+
+
+def test_breach_hits_are_remembered_without_refetching(fake_session):
+    password = "correct-horse"
+    prefix, suffix = _hex(password)[:5], _hex(password)[5:].encode()
+    fake_session.bodies[prefix] = suffix + b":5"
+
+    assert password_core.check_hibp_breach(password) is True
+    assert password_core._sha1_digest(password) in password_core._breached_hashes()
+
+    assert password_core.check_hibp_breach(password) is True
+    # Even with the digest and range caches dropped, the known-breached set answers
+    password_core._breach_by_hash.clear()
+    password_core._fetch_hibp_range.clear()
+    assert password_core.check_hibp_breach(password) is True
+    assert fake_session.requested == [prefix]